@@ -0,0 +1,335 @@
+"""
+A compact board representation for the default 4x4 game of "2048".
+
+Every tile value is a power of the root tile value, so its exponent
+fits in 4 bits and the whole board packs into a single 64-bit integer
+(16 nibbles, one per cell, 0 meaning empty). Sliding a row becomes a
+lookup keyed by a 16-bit row word instead of a Python loop over tiles.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# The board size this representation is specialized for
+BOARD_SIZE = 4
+# A single row of the board, 4 nibbles
+ROW_MASK = 0xFFFF
+# The largest exponent a tile may hold so a merge still fits in a nibble
+MAX_EXPONENT = 14
+
+
+def pack(values, root: int = 2) -> Optional[int]:
+    """
+    Pack a 4x4 board of tile values into a 64-bit integer.
+
+    Each cell stores the exponent of its value in base `root` as one
+    nibble; empty cells (value 0) store 0. Row r, column c occupies
+    bits [4 * (4r + c), 4 * (4r + c) + 4).
+
+    Args:
+        values: A 4x4 matrix of tile values
+        root: The root tile value
+
+    Returns:
+        Optional[int]: The packed board, or None if any value is not a
+            power of `root` with exponent 1..MAX_EXPONENT
+    """
+    board = 0
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            value = int(values[r][c])
+            if value == 0:
+                continue
+
+            exponent = 0
+            while value > 1 and value % root == 0:
+                value //= root
+                exponent += 1
+
+            if value != 1 or exponent == 0 or exponent > MAX_EXPONENT:
+                return None
+
+            board |= exponent << (4 * (BOARD_SIZE * r + c))
+    return board
+
+
+def unpack(board: int, root: int = 2) -> np.ndarray:
+    """
+    Unpack a 64-bit board into a 4x4 array of tile values.
+
+    Args:
+        board: The packed board
+        root: The root tile value
+
+    Returns:
+        np.ndarray: The 4x4 int32 matrix of tile values
+    """
+    values = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.int32)
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            exponent = (board >> (4 * (BOARD_SIZE * r + c))) & 0xF
+            if exponent:
+                values[r, c] = root**exponent
+    return values
+
+
+def reverse_row(row: int) -> int:
+    """
+    Reverse the 4 nibbles of a 16-bit row word
+    """
+    return (
+        ((row & 0x000F) << 12)
+        | ((row & 0x00F0) << 4)
+        | ((row & 0x0F00) >> 4)
+        | ((row & 0xF000) >> 12)
+    )
+
+
+@lru_cache(maxsize=None)
+def _compute_row_slide(row: int, root: int) -> tuple[int, int, int]:
+    """
+    Slide and merge a single 16-bit row word towards column 0.
+
+    Scalar reference implementation; `slide_row_left` serves the
+    default root from the precomputed tables instead.
+
+    Args:
+        row: The row word, 4 exponent nibbles
+        root: The root tile value, used for scoring
+
+    Returns:
+        tuple[int, int, int]: The new row word, the score gained from
+            merges, and the per-cell movement offsets packed as 4-bit
+            two's complement nibbles
+    """
+    exponents = [(row >> (4 * c)) & 0xF for c in range(BOARD_SIZE)]
+
+    new_exponents = [0] * BOARD_SIZE
+    movement = [0] * BOARD_SIZE
+    score = 0
+
+    new_index = 0
+    for i in range(BOARD_SIZE):
+        exponent = exponents[i]
+        if exponent == 0:
+            continue
+
+        if exponent == new_exponents[new_index]:
+            new_exponents[new_index] = exponent + 1
+            movement[i] = new_index - i
+            new_index += 1
+            score += root ** (exponent + 1)
+        elif new_exponents[new_index] == 0:
+            new_exponents[new_index] = exponent
+            movement[i] = new_index - i
+        else:
+            new_index += 1
+            new_exponents[new_index] = exponent
+            movement[i] = new_index - i
+
+    new_row = 0
+    movement_word = 0
+    for c in range(BOARD_SIZE):
+        new_row |= new_exponents[c] << (4 * c)
+        movement_word |= (movement[c] & 0xF) << (4 * c)
+
+    return new_row, score, movement_word
+
+
+# Fully specialized slide tables for the default root of 2, one entry
+# per possible 16-bit row word. Built once at import; module globals so
+# future jitted kernels can read them as constants
+LEFT_NEW = np.empty(ROW_MASK + 1, dtype=np.uint16)
+LEFT_SCORE = np.empty(ROW_MASK + 1, dtype=np.int32)
+LEFT_MOVE = np.empty(ROW_MASK + 1, dtype=np.uint16)
+
+
+def _build_left_tables():
+    """
+    Populate the left-slide lookup tables from the scalar reference
+    implementation. One-time cost at import
+    """
+    for row in range(ROW_MASK + 1):
+        new_row, score, movement_word = _compute_row_slide(row, 2)
+        LEFT_NEW[row] = new_row
+        LEFT_SCORE[row] = score
+        LEFT_MOVE[row] = movement_word
+    _compute_row_slide.cache_clear()
+
+
+_build_left_tables()
+
+
+def slide_row_left(row: int, root: int = 2) -> tuple[int, int, int]:
+    """
+    Slide and merge a single 16-bit row word towards column 0.
+
+    For the default root of 2 this is three table loads; other roots
+    fall back to the cached scalar implementation.
+
+    Args:
+        row: The row word, 4 exponent nibbles
+        root: The root tile value, used for scoring
+
+    Returns:
+        tuple[int, int, int]: The new row word, the score gained from
+            merges, and the per-cell movement offsets packed as 4-bit
+            two's complement nibbles
+    """
+    if root == 2:
+        return int(LEFT_NEW[row]), int(LEFT_SCORE[row]), int(LEFT_MOVE[row])
+
+    return _compute_row_slide(row, root)
+
+
+def decode_movement(movement_word: int) -> list[int]:
+    """
+    Decode a packed movement word into a list of signed offsets
+    """
+    offsets = []
+    for c in range(BOARD_SIZE):
+        nibble = (movement_word >> (4 * c)) & 0xF
+        offsets.append(nibble - 16 if nibble >= 8 else nibble)
+    return offsets
+
+
+class FastBoard:
+    """
+    A 4x4 board packed into a single 64-bit integer.
+
+    Args:
+        board: The packed board, see `pack`
+        root: The root tile value
+    """
+
+    def __init__(self, board: int = 0, root: int = 2):
+        self.board = board
+        self.root = root
+
+    @classmethod
+    def from_values(cls, values, root: int = 2) -> Optional["FastBoard"]:
+        """
+        Build a FastBoard from a 4x4 matrix of tile values. Returns
+        None if the values cannot be packed
+        """
+        board = pack(values, root)
+        if board is None:
+            return None
+        return cls(board, root)
+
+    def to_values(self) -> np.ndarray:
+        """
+        Return the board as a 4x4 int32 matrix of tile values
+        """
+        return unpack(self.board, self.root)
+
+    def get_row(self, row: int) -> int:
+        """
+        Return the 16-bit word for a given row
+        """
+        return (self.board >> (16 * row)) & ROW_MASK
+
+    def transpose(self):
+        """
+        Transpose the board in place.
+
+        Branchless two-step SWAR transpose: first swap the off-diagonal
+        nibbles within each 2x2 block of cells, then swap the two
+        off-diagonal 2x2 blocks, moving every nibble in 6 mask/shift
+        ops instead of 16 extract/insert loop iterations
+        """
+        board = self.board
+        swapped = (
+            (board & 0xF0F00F0FF0F00F0F)
+            | ((board & 0x0000F0F00000F0F0) << 12)
+            | ((board & 0x0F0F00000F0F0000) >> 12)
+        )
+        self.board = (
+            (swapped & 0xFF00FF0000FF00FF)
+            | ((swapped & 0x00FF00FF00000000) >> 24)
+            | ((swapped & 0x00000000FF00FF00) << 24)
+        )
+
+    def slide_left(self) -> tuple[int, list[list[int]]]:
+        """
+        Slide all rows towards column 0.
+
+        Returns:
+            tuple[int, list[list[int]]]: The score gained and the
+                movement matrix
+        """
+        board = 0
+        score = 0
+        movement = []
+        for r in range(BOARD_SIZE):
+            new_row, row_score, movement_word = slide_row_left(
+                self.get_row(r), self.root
+            )
+            board |= new_row << (16 * r)
+            score += row_score
+            movement.append(decode_movement(movement_word))
+
+        self.board = board
+        return score, movement
+
+    def slide_right(self) -> tuple[int, list[list[int]]]:
+        """
+        Slide all rows towards column 3.
+
+        Returns:
+            tuple[int, list[list[int]]]: The score gained and the
+                movement matrix
+        """
+        board = 0
+        score = 0
+        movement = []
+        for r in range(BOARD_SIZE):
+            new_row, row_score, movement_word = slide_row_left(
+                reverse_row(self.get_row(r)), self.root
+            )
+            board |= reverse_row(new_row) << (16 * r)
+            score += row_score
+            offsets = decode_movement(movement_word)
+            movement.append([-offsets[BOARD_SIZE - 1 - c] for c in range(BOARD_SIZE)])
+
+        self.board = board
+        return score, movement
+
+    def slide_up(self) -> tuple[int, list[list[int]]]:
+        """
+        Slide all columns towards row 0.
+
+        Returns:
+            tuple[int, list[list[int]]]: The score gained and the
+                movement matrix
+        """
+        self.transpose()
+        score, movement = self.slide_left()
+        self.transpose()
+        return score, [list(offsets) for offsets in zip(*movement)]
+
+    def slide_down(self) -> tuple[int, list[list[int]]]:
+        """
+        Slide all columns towards row 3.
+
+        Returns:
+            tuple[int, list[list[int]]]: The score gained and the
+                movement matrix
+        """
+        self.transpose()
+        score, movement = self.slide_right()
+        self.transpose()
+        return score, [list(offsets) for offsets in zip(*movement)]
+
+    def __eq__(self, other: "FastBoard") -> bool:
+        if isinstance(other, FastBoard):
+            return self.board == other.board and self.root == other.root
+        return False
+
+    def __repr__(self) -> str:
+        return f"FastBoard(board={self.board:#018x}, root={self.root})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
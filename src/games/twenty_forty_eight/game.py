@@ -8,22 +8,28 @@ Original: https://play2048.co/
 """
 
 import json
-import random
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import cached_property
+from numbers import Number
 from typing import Any, Optional
 
 import numpy as np
+from numba import njit, prange
+from numpy.typing import ArrayLike
 
-from src.tiled_tools.common.custom_typing import AnyNumber, is_numeric
+from src.games.twenty_forty_eight.fast_board import BOARD_SIZE, FastBoard
+from src.tiled_tools.common.custom_typing import AnyNumber
 from src.tiled_tools.common.grid import Grid
 
 
 # pylint: disable=too-many-instance-attributes
-@dataclass
+@dataclass(frozen=True)
 class GameConfig:
     """
-    Game config options for a game of 2048
+    Game config options for a game of 2048.
+
+    Frozen so the serialized forms below can be cached
     """
 
     grid_size: int = 4
@@ -38,24 +44,12 @@ class GameConfig:
     spawn_kill: bool = False
     root_tile_value: int = 2
 
-    def to_json(self) -> str:
-        """
-        Converts the config to a json string
-        """
-        return json.dumps(
-            {
-                "grid_size": self.grid_size,
-                "spawn_tile_count": self.spawn_tile_count,
-                "starting_tile_count": self.starting_tile_count,
-                "win_tile_value": self.win_tile_value,
-                "mutation_probability": self.mutation_probability,
-                "mutation_at_start": self.mutation_at_start,
-                "spawn_kill": self.spawn_kill,
-                "root_tile_value": self.root_tile_value,
-            }
-        )
+    @cached_property
+    def _json(self) -> str:
+        return json.dumps(asdict(self))
 
-    def __repr__(self) -> str:
+    @cached_property
+    def _repr(self) -> str:
         return (
             f"Game(grid_size={self.grid_size}, "
             f"spawn_tile_count={self.spawn_tile_count}, "
@@ -67,10 +61,23 @@ class GameConfig:
             f"root_tile_value={self.root_tile_value})"
         )
 
+    def to_json(self) -> str:
+        """
+        Converts the config to a json string
+        """
+        return self._json
+
+    def __repr__(self) -> str:
+        return self._repr
+
     def __str__(self) -> str:
         return self.__repr__()
 
 
+# How many random floats to draw from the generator per batch
+RAND_BUFFER_SIZE = 4096
+
+
 class SlideDirection(Enum):
     """
     Which direction to slide the tiles
@@ -87,26 +94,33 @@ class Tile:
     """
     A single tile and data
 
+    Movement during a slide lives in the game's movement_matrix, not on
+    the tile itself
+
     Args:
         value: Value of the tile, if None, the tile is empty
-        momentum: The direction the tile is moving, resprented as (c, r)
     """
 
-    def __init__(self, value: int, momentum: SlideDirection = SlideDirection.NONE):
+    # No per-instance __dict__; tiles are created in bulk at the I/O
+    # boundary, so the smaller footprint adds up
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
         """
-        Create a new tile with a value and momentum
+        Create a new tile with a value
         """
         self.value = value
-        self.momentum = momentum
 
     def __eq__(self, other: "Tile"):
-        if isinstance(other, Tile):
+        # Tile-vs-Tile is by far the common case, check it first
+        if other.__class__ is Tile:
             return self.value == other.value
 
-        if is_numeric(other):
+        if isinstance(other, (int, float, Number)):
             return self.value == other
 
-        return False
+        # Let Python try the reflected comparison instead of eating it
+        return NotImplemented
 
     def __repr__(self) -> str:
         return str(self.value)
@@ -132,10 +146,7 @@ class TileHelper:
         Returns:
             Grid: A grid of tiles with the given value
         """
-        tiles = [
-            [Tile(value=value, momentum=SlideDirection.NONE) for _i in range(size)]
-            for _j in range(size)
-        ]
+        tiles = [[Tile(value=value) for _i in range(size)] for _j in range(size)]
         return Grid(tiles)
 
 
@@ -164,20 +175,20 @@ class ArrayHelper:
         """
         Returns the index of the first non-zero element in an array
         """
-        for i in range(start_index, len(array)):
-            if array[i] != 0:
-                return i
-        return -1
+        mask = np.asarray(array[start_index:]) != 0
+        if not mask.any():
+            return -1
+        return int(np.argmax(mask)) + start_index
 
     @staticmethod
     def first_zero_index(array: list[AnyNumber], start_index: int = 0) -> int:
         """
         Returns the index of the first zero element in an array
         """
-        for i in range(start_index, len(array)):
-            if array[i] == 0:
-                return i
-        return -1
+        mask = np.asarray(array[start_index:]) == 0
+        if not mask.any():
+            return -1
+        return int(np.argmax(mask)) + start_index
 
     @staticmethod
     def transpose_columns(array: list[list[any]]) -> list[list[AnyNumber]]:
@@ -187,6 +198,171 @@ class ArrayHelper:
         return [list(row) for row in zip(*array)]
 
 
+@njit(cache=True)
+def _slide_1d(
+    arr: np.ndarray, reverse: bool, root: int
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Slide and merge a single row or column of values towards index 0.
+
+    The interpreter loop in the old `_slide_helper` dominated per-turn
+    cost, so the merge loop is JIT compiled as a 1-D integer kernel.
+
+    Args:
+        arr: The values of the row or column to slide
+        reverse: Whether to slide towards the high index instead
+        root: The root tile value, merged tiles multiply by this
+
+    Returns:
+        The new values, the per-cell movement offsets, and the score
+        gained from merges
+    """
+    n = arr.shape[0]
+    new_arr = np.zeros(n, dtype=np.int64)
+    movement = np.zeros(n, dtype=np.int64)
+    score_delta = 0
+
+    # Direction is handled by mapping the logical index i onto the
+    # array from either end, rather than reversing copies of the input
+    # and output
+    new_index = 0
+    for i in range(n):
+        src = n - 1 - i if reverse else i
+        value = arr[src]
+        if value == 0:
+            continue
+
+        dest = n - 1 - new_index if reverse else new_index
+        slot = new_arr[dest]
+
+        if value == slot:
+            # Merge into the occupied slot
+            offset = new_index - i
+            new_value = value * root
+            new_index += 1
+            score_delta += new_value
+        elif slot == 0:
+            # Slot is free, move into it
+            offset = new_index - i
+            new_value = value
+        else:
+            # Slot holds a different value, move next to it
+            new_index += 1
+            dest = n - 1 - new_index if reverse else new_index
+            offset = new_index - i
+            new_value = value
+
+        if reverse:
+            offset = -offset
+
+        new_arr[dest] = new_value
+        movement[src] = offset
+
+    return new_arr, movement, score_delta
+
+
+@njit(cache=True)
+def _slide_board(
+    values: np.ndarray, vertical: bool, reverse: bool, root: int
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Slide and merge the whole board in one pass.
+
+    Fuses the per-row/column kernel, the transpose, and the grid
+    rebuild into a single loop nest; orientation is handled with index
+    arithmetic, so no intermediate copies are made.
+
+    Args:
+        values: The (N, N) board values
+        vertical: Whether to slide along columns instead of rows
+        reverse: Whether to slide towards the high index (down/right)
+        root: The root tile value, merged tiles multiply by this
+
+    Returns:
+        The new board values, the movement matrix, and the score
+        gained from merges
+    """
+    n = values.shape[0]
+    new_values = np.zeros_like(values)
+    movement = np.zeros((n, n), dtype=np.int64)
+    score_delta = 0
+
+    for line in range(n):
+        new_index = 0
+        for i in range(n):
+            src = n - 1 - i if reverse else i
+            value = values[src, line] if vertical else values[line, src]
+            if value == 0:
+                continue
+
+            dest = n - 1 - new_index if reverse else new_index
+            slot = new_values[dest, line] if vertical else new_values[line, dest]
+
+            if value == slot:
+                # Merge into the occupied slot
+                offset = new_index - i
+                new_value = value * root
+                new_index += 1
+                score_delta += new_value
+            elif slot == 0:
+                # Slot is free, move into it
+                offset = new_index - i
+                new_value = value
+            else:
+                # Slot holds a different value, move next to it
+                new_index += 1
+                dest = n - 1 - new_index if reverse else new_index
+                offset = new_index - i
+                new_value = value
+
+            if reverse:
+                offset = -offset
+
+            if vertical:
+                new_values[dest, line] = new_value
+                movement[src, line] = offset
+            else:
+                new_values[line, dest] = new_value
+                movement[line, src] = offset
+
+    return new_values, movement, score_delta
+
+
+@njit(parallel=True, cache=True)
+def simulate_batch(boards: np.ndarray, moves: np.ndarray, root: int = 2) -> np.ndarray:
+    """
+    Slide a batch of independent boards in one parallel pass.
+
+    Intended for self-play and rollout workloads, where many games are
+    simulated at once; the boards are independent, so each one is slid
+    on its own thread.
+
+    Args:
+        boards: A (B, N, N) int array of board values, updated in place
+        moves: A (B,) int array of SlideDirection values, one per board
+        root: The root tile value, merged tiles multiply by this
+
+    Returns:
+        np.ndarray: A (B,) int64 array of the score gained per board
+    """
+    batch_size = boards.shape[0]
+    scores = np.zeros(batch_size, dtype=np.int64)
+
+    for b in prange(batch_size):  # pylint: disable=not-an-iterable
+        direction = moves[b]
+        # See SlideDirection: UP = 1, RIGHT = 2, DOWN = 3, LEFT = 4
+        vertical = direction == 1 or direction == 3
+        reverse = direction == 2 or direction == 3
+
+        new_values, _movement, score_delta = _slide_board(
+            boards[b], vertical, reverse, root
+        )
+        boards[b] = new_values
+        scores[b] = score_delta
+
+    return scores
+
+
 class PlayBlocker(Enum):
     """
     Reasons why a game cannot be played
@@ -209,26 +385,59 @@ class Game:
         # Whether the game is in the initial spawn mode
         self.init_mode = True
 
-        self.grid = TileHelper.build_grid_with_value(0, self.config.grid_size)
+        grid_size = self.config.grid_size
+
+        # Tile values are stored as a flat int array rather than Tile
+        # objects, so the hot path never chases per-cell PyObjects.
+        # Tiles are only materialized at the I/O boundary, see `grid`
+        self.values = np.zeros((grid_size, grid_size), dtype=np.int32)
         self.score = 0
 
-        # Useful for UIs, as they get richer information on what happened during a slide
-        self.movement_matrix = [
-            [0 for _i in range(self.config.grid_size)]
-            for _j in range(self.config.grid_size)
-        ]
+        # Useful for UIs, as they get richer information on what happened
+        # during a slide. Offsets are at most grid_size - 1, so bytes
+        # suffice; the buffer is reused across slides
+        self.movement_matrix = np.zeros((grid_size, grid_size), dtype=np.int8)
         self.latest_spawn_result: Optional[SlideResult] = None
         self.latest_spawn_locations: list[tuple[int, int]] = []
 
+        # Cached empty cells for the spawn path, so spawning several
+        # tiles in one turn does not rescan the board per tile.
+        # None means stale; recomputed lazily on the next spawn
+        self._empty_cells: Optional[list[tuple[int, int]]] = None
+
+        # Random numbers are drawn in batches; one-at-a-time calls into
+        # the generator are dominated by dispatch overhead
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.random(RAND_BUFFER_SIZE)
+        self._rand_idx = 0
+
         self.initial_spawn()
 
+    @property
+    def grid(self) -> Grid:
+        """
+        The board as a Grid of Tile objects, materialized on demand.
+
+        This is an I/O-boundary view; writes to the returned grid do not
+        affect the game state. Use `set_tiles` or `values` to mutate
+        """
+        return Grid([[Tile(int(value)) for value in row] for row in self.values])
+
     def set_tiles(self, new_list: list[list[Tile]]):
         """
-        Set the grid of the game
+        Set the grid of the game from Tile objects.
+
+        Public API shim; internal code paths set values directly via
+        `_set_values` and never allocate Tiles
         """
-        for r in range(self.config.grid_size):
-            for c in range(self.config.grid_size):
-                self.grid.set(c, r, new_list[r][c])
+        self._set_values([[tile.value for tile in row] for row in new_list])
+
+    def _set_values(self, new_values: ArrayLike):
+        """
+        Set the board values directly
+        """
+        self.values[:] = new_values
+        self._empty_cells = None
 
     def initial_spawn(self):
         """
@@ -266,18 +475,15 @@ class Game:
         Returns whether the game can be played
         """
 
-        # If any tile has a neighbor with the same value, the game can be played
-        for r in range(self.config.grid_size):
-            for c in range(self.config.grid_size):
-                tile = self.grid.get(c, r)
-                if tile.value == 0:
-                    return True
+        values = self.values
 
-                neighbors = self.grid.get_adjacent(c, r)
-                for neighbor in neighbors:
-                    if neighbor.value == tile.value:
-                        return True
-        return False
+        # The game can be played if any tile is empty, or any
+        # horizontal or vertical neighbor pair is equal
+        return bool(
+            (values == 0).any()
+            or (values[:, :-1] == values[:, 1:]).any()
+            or (values[:-1, :] == values[1:, :]).any()
+        )
 
     def slide_tiles(self, direction: SlideDirection):
         """
@@ -286,16 +492,51 @@ class Game:
         Args:
             direction: The direction to slide the tiles
         """
-        if direction in [SlideDirection.UP, SlideDirection.DOWN]:
-            new_grid_values, movement_matrix = self.slide_each_column(direction)
+        if self.config.grid_size == BOARD_SIZE:
+            movement_matrix = self._slide_fast(direction)
+            if movement_matrix is not None:
+                return movement_matrix
+
+        vertical = direction in [SlideDirection.UP, SlideDirection.DOWN]
+        reverse = direction in [SlideDirection.DOWN, SlideDirection.RIGHT]
+
+        new_values, movement, score_delta = _slide_board(
+            self.values, vertical, reverse, self.config.root_tile_value
+        )
+        self.values[:] = new_values
+        self.score += int(score_delta)
+        self.movement_matrix[:] = movement
+        self._empty_cells = None
+
+        return self.movement_matrix
+
+    def _slide_fast(self, direction: SlideDirection) -> Optional[list[list[int]]]:
+        """
+        Slide using the packed FastBoard representation.
+
+        Only possible when every tile value is a power of the root tile
+        value that fits in a nibble; returns None otherwise, in which
+        case the caller falls back to the array kernel
+        """
+        board = FastBoard.from_values(self.values, self.config.root_tile_value)
+        if board is None:
+            return None
+
+        if direction == SlideDirection.UP:
+            score_delta, movement_matrix = board.slide_up()
+        elif direction == SlideDirection.DOWN:
+            score_delta, movement_matrix = board.slide_down()
+        elif direction == SlideDirection.RIGHT:
+            score_delta, movement_matrix = board.slide_right()
         else:
-            new_grid_values, movement_matrix = self.slide_each_row(direction)
+            score_delta, movement_matrix = board.slide_left()
 
-        new_tiles = [[Tile(value) for value in row] for row in new_grid_values]
-        self.set_tiles(new_tiles)
-        self.movement_matrix = movement_matrix
+        self.values[:] = board.to_values()
+        self.score += score_delta
+        self.movement_matrix[:] = movement_matrix
+        self._empty_cells = None
 
-        return movement_matrix
+        return self.movement_matrix
 
     def slide_each_column(
         self, direction: SlideDirection
@@ -307,17 +548,20 @@ class Game:
             direction: The direction to slide the columns, either up or down
         """
 
+        grid_size = self.config.grid_size
+        values = self.values
+
         new_grid_values = []
         movement_matrix = []
 
-        for c in range(self.config.grid_size):
-            column = [tile.value for tile in self.grid.get_col(c)]
+        for c in range(grid_size):
+            column = values[:, c].tolist()
             new_column, movement = self._slide_helper(direction, column)
             new_grid_values.append(new_column)
             movement_matrix.append(movement)
 
-        new_grid_values = ArrayHelper.transpose_columns(new_grid_values)
-        movement_matrix = ArrayHelper.transpose_columns(movement_matrix)
+        new_grid_values = np.asarray(new_grid_values).T.tolist()
+        movement_matrix = np.asarray(movement_matrix).T.tolist()
 
         return new_grid_values, movement_matrix
 
@@ -331,11 +575,14 @@ class Game:
             direction: The direction to slide the rows, either left or right
         """
 
+        grid_size = self.config.grid_size
+        values = self.values
+
         new_grid_values = []
         movement_matrix = []
 
-        for r in range(self.config.grid_size):
-            row = [tile.value for tile in self.grid.get_row(r)]
+        for r in range(grid_size):
+            row = values[r].tolist()
             new_row, movement = self._slide_helper(direction, row)
             new_grid_values.append(new_row)
             movement_matrix.append(movement)
@@ -352,40 +599,16 @@ class Game:
             direction: The direction to slide the row/column
             row_o_col: The row or column to slide
         """
-        l_copy = list(row_o_col)
-
-        # Reverse the list if sliding down or right
-        if direction in [SlideDirection.DOWN, SlideDirection.RIGHT]:
-            l_copy = l_copy[::-1]
-
-        new_list = [0 for _ in l_copy]
-        movement = [0 for _ in l_copy]
-
-        new_index = 0
-        start_index = ArrayHelper.first_non_zero_index(l_copy)
-        for i in range(start_index, len(l_copy)):
-            if l_copy[i] == 0:
-                continue
-
-            if l_copy[i] == new_list[new_index]:
-                new_list[new_index] *= self.config.root_tile_value
-                movement[i] = new_index - i
-                new_index += 1
-                self.score += l_copy[i] * self.config.root_tile_value
-            else:
-                if new_list[new_index] == 0:
-                    new_list[new_index] = l_copy[i]
-                    movement[i] = new_index - i
-                else:
-                    new_list[new_index + 1] = l_copy[i]
-                    movement[i] = new_index + 1 - i
-                    new_index += 1
+        # Slide towards the high index when sliding down or right
+        reverse = direction in [SlideDirection.DOWN, SlideDirection.RIGHT]
 
-        if direction in [SlideDirection.DOWN, SlideDirection.RIGHT]:
-            new_list = new_list[::-1]
-            movement = [-offset for offset in movement[::-1]]
+        arr = np.asarray(row_o_col, dtype=np.int64)
+        new_arr, movement, score_delta = _slide_1d(
+            arr, reverse, self.config.root_tile_value
+        )
+        self.score += int(score_delta)
 
-        return new_list, movement
+        return new_arr.tolist(), movement.tolist()
 
     def spawn_new_tiles(self) -> bool:
         """
@@ -409,36 +632,21 @@ class Game:
         Checks if the board is full
         """
 
-        for r in range(self.config.grid_size):
-            for c in range(self.config.grid_size):
-                # 0 is empty
-                if self.grid.get(c, r).value == 0:
-                    return False
-
-        return True
+        # 0 is empty
+        return bool((self.values != 0).all())
 
     def get_empty_tiles(self) -> list[tuple[int, int]]:
         """
         Returns a list of empty tiles
         """
-        empty_tiles = []
-        for r in range(self.config.grid_size):
-            for c in range(self.config.grid_size):
-                if self.grid.get(c, r).value == 0:
-                    empty_tiles.append((c, r))
-        return empty_tiles
+        rows, cols = np.where(self.values == 0)
+        return list(zip(cols.tolist(), rows.tolist()))
 
     def get_highest_tile(self) -> int:
         """
         Returns the value of the highest tile on the board
         """
-        highest_tile = 0
-        for r in range(self.config.grid_size):
-            for c in range(self.config.grid_size):
-                tile = self.grid.get(c, r)
-                if tile.value > highest_tile:
-                    highest_tile = tile.value
-        return highest_tile
+        return int(self.values.max())
 
     def _spawn_new_tile(self) -> Optional[tuple[int, int]]:
         """
@@ -448,33 +656,47 @@ class Game:
             Optional[tuple[int, int]]: The position of the new tile. None if the new tile
                 could not be placed
         """
-        new_tile = self._get_new_tile()
+        new_tile_value = self._get_new_tile_value()
         new_tile_pos = self._get_random_empty_tile()
 
         if new_tile_pos is None:
             return None
 
-        self.grid.set(new_tile_pos[0], new_tile_pos[1], new_tile)
+        self.values[new_tile_pos[1], new_tile_pos[0]] = new_tile_value
         return new_tile_pos
 
-    def _get_new_tile(self) -> Tile:
+    def _get_random_empty_tile(self) -> Optional[tuple[int, int]]:
         """
-        Returns a new tile with a value based on the config
+        Returns a random empty tile. If there are no empty tiles, returns None
         """
-        new_tile_value = self._get_new_tile_value()
-        return Tile(value=new_tile_value)
+        if self._empty_cells is None:
+            self._empty_cells = self.get_empty_tiles()
 
-    def _get_random_empty_tile(self) -> Optional[tuple[int, int]]:
+        empty_tiles = self._empty_cells
+        if not empty_tiles:
+            return None
+
+        random_index = int(self._rng.integers(0, len(empty_tiles)))
+        chosen = empty_tiles[random_index]
+
+        # Swap-pop so removal is O(1); order of the cache is irrelevant
+        empty_tiles[random_index] = empty_tiles[-1]
+        empty_tiles.pop()
+
+        return chosen
+
+    def _next_random(self) -> float:
         """
-        Returns a random empty tile. If there are no empty tiles, returns None
+        Returns the next float in [0, 1) from the batched RNG buffer,
+        refilling it when exhausted
         """
-        empty_tiles = self.get_empty_tiles()
-        tiles_len = len(empty_tiles)
+        if self._rand_idx == RAND_BUFFER_SIZE:
+            self._rand_buf = self._rng.random(RAND_BUFFER_SIZE)
+            self._rand_idx = 0
 
-        if empty_tiles:
-            random_index = random.randint(0, tiles_len - 1)
-            return empty_tiles[random_index]
-        return None
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return float(value)
 
     def _get_new_tile_value(self) -> AnyNumber:
         """
@@ -482,7 +704,7 @@ class Game:
         its square, depending on the mutation probability
         """
         root_tile_value = self.config.root_tile_value
-        should_mutate = np.random.rand() < self.config.mutation_probability
+        should_mutate = self._next_random() < self.config.mutation_probability
         mutated_value = root_tile_value * root_tile_value
 
         if self.init_mode:
@@ -504,18 +726,17 @@ class Game:
         Converts the game to a dict
         """
         return {
-            "config": self.config.__dict__,
-            "grid": [[tile.value for tile in row] for row in self.grid.tolist()],
+            "config": asdict(self.config),
+            "grid": self.values.tolist(),
             "score": self.score,
-            "movement_matrix": self.movement_matrix,
+            "movement_matrix": self.movement_matrix.tolist(),
             "latest_spawn_result": self.latest_spawn_result,
             "latest_spawn_locations": self.latest_spawn_locations,
         }
 
     def __repr__(self) -> str:
-        tile_matrix = self.grid.tolist()
-        tile_matrix = [[str(tile) for tile in row] for row in tile_matrix]
-        return "\n".join([" ".join(row) for row in tile_matrix])
+        value_matrix = [[str(value) for value in row] for row in self.values]
+        return "\n".join([" ".join(row) for row in value_matrix])
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -534,11 +755,11 @@ class GameHelper:
         game_dict = json.loads(json_string)
         config = GameConfig(**game_dict["config"])
         game = Game(config=config)
-        game.set_tiles(
-            [[Tile(value=value) for value in row] for row in game_dict["grid"]]
+        game._set_values(  # pylint: disable=protected-access
+            np.asarray(game_dict["grid"], dtype=np.int32)
         )
         game.score = game_dict["score"]
-        game.movement_matrix = game_dict["movement_matrix"]
+        game.movement_matrix = np.asarray(game_dict["movement_matrix"], dtype=np.int8)
         game.latest_spawn_result = game_dict["latest_spawn_result"]
         game.latest_spawn_locations = game_dict["latest_spawn_locations"]
 
@@ -2,6 +2,8 @@
 
 import unittest
 
+import numpy as np
+
 from src.games.twenty_forty_eight.game import (
     Game,
     GameConfig,
@@ -9,6 +11,7 @@ from src.games.twenty_forty_eight.game import (
     SlideDirection,
     SlideResult,
     Tile,
+    simulate_batch,
 )
 from src.tiled_tools.common.grid import Grid
 
@@ -47,9 +50,11 @@ class Test2048(unittest.TestCase):
         self.assertFalse(self.game.board_full())
 
         # Fill the board
-        for i in range(self.game.config.grid_size):
-            for j in range(self.game.config.grid_size):
-                self.game.grid.get(i, j).value = 2
+        all_twos = [
+            [Tile(2) for _ in range(self.game.config.grid_size)]
+            for _ in range(self.game.config.grid_size)
+        ]
+        self.game.set_tiles(all_twos)
 
         self.assertTrue(self.game.board_full())
 
@@ -136,7 +141,7 @@ class TestGameOperations(unittest.TestCase):
         self.game.set_tiles(tile_list)
         self.assertEqual(self.game.grid.tolist(), tile_list)
 
-        self.game.grid.set(0, 0, Tile(-10))
+        self.game.values[0, 0] = -10
 
         self.assertNotEqual(self.game.grid.tolist(), tile_list)
 
@@ -158,7 +163,7 @@ class TestGameOperations(unittest.TestCase):
             [-3, -3, 0, -3],
         ]
         expected_tiled = [[Tile(val) for val in row] for row in expected]
-        self.assertListEqual(game.movement_matrix, expected_movement)
+        self.assertListEqual(game.movement_matrix.tolist(), expected_movement)
         self.assertEqual(game.grid, Grid(expected))
 
         game = Game()
@@ -177,7 +182,7 @@ class TestGameOperations(unittest.TestCase):
             [0, 0, 0, 0],
         ]
         expected_tiled = [[Tile(val) for val in row] for row in expected]
-        self.assertListEqual(game.movement_matrix, expected_movement)
+        self.assertListEqual(game.movement_matrix.tolist(), expected_movement)
         self.assertEqual(game.grid, Grid(expected_tiled))
 
         game = Game()
@@ -196,7 +201,7 @@ class TestGameOperations(unittest.TestCase):
             [2, 2, 0, 0],
         ]
         expected_tiled = [[Tile(val) for val in row] for row in expected]
-        self.assertListEqual(game.movement_matrix, expected_movement)
+        self.assertListEqual(game.movement_matrix.tolist(), expected_movement)
         self.assertEqual(game.grid, Grid(expected_tiled))
 
         game = Game()
@@ -216,7 +221,7 @@ class TestGameOperations(unittest.TestCase):
         ]
         expected_tiled = [[Tile(val) for val in row] for row in expected]
         self.assertEqual(game.grid, Grid(expected_tiled))
-        self.assertListEqual(game.movement_matrix, expected_movement)
+        self.assertListEqual(game.movement_matrix.tolist(), expected_movement)
 
         game = Game()
         game.set_tiles(self.full_tile_list)
@@ -253,7 +258,7 @@ class TestGameOperations(unittest.TestCase):
         ]
         expected_tiled = [[Tile(val) for val in row] for row in expected]
         self.assertEqual(game.grid, Grid(expected_tiled))
-        self.assertListEqual(game.movement_matrix, expected_movement)
+        self.assertListEqual(game.movement_matrix.tolist(), expected_movement)
 
     def test_play_turn(self):
         result = self.game.play_turn(SlideDirection.UP)
@@ -263,6 +268,38 @@ class TestGameOperations(unittest.TestCase):
         self.assertTrue(self.game.latest_spawn_result)
 
 
+class TestSimulateBatch(unittest.TestCase):
+    def setUp(self):
+        # fmt: off
+        self.power_vals = [
+            [2, 2, 2, 2],
+            [0, 0, 0, 0],
+            [0, 0, 4, 0],
+            [2, 2, 0, 2]
+        ]
+        # fmt: on
+        self.directions = [
+            SlideDirection.UP,
+            SlideDirection.RIGHT,
+            SlideDirection.DOWN,
+            SlideDirection.LEFT,
+        ]
+
+    def test_matches_single_game_slides(self):
+        boards = np.array([self.power_vals] * 4, dtype=np.int64)
+        moves = np.array([direction.value for direction in self.directions])
+
+        scores = simulate_batch(boards, moves)
+
+        for board, score, direction in zip(boards, scores, self.directions):
+            game = Game()
+            game.set_tiles([[Tile(val) for val in row] for row in self.power_vals])
+            game.slide_tiles(direction)
+
+            self.assertEqual(board.tolist(), game.values.tolist())
+            self.assertEqual(int(score), game.score)
+
+
 class TestTile(unittest.TestCase):
     def setUp(self):
         self.tile = Tile(2)
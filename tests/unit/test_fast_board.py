@@ -0,0 +1,134 @@
+# pylint: disable=missing-docstring,line-too-long
+
+import unittest
+
+from src.games.twenty_forty_eight.fast_board import (
+    FastBoard,
+    pack,
+    reverse_row,
+    slide_row_left,
+    unpack,
+)
+
+
+class TestPacking(unittest.TestCase):
+    def setUp(self):
+        # fmt: off
+        self.power_vals = [
+            [2, 2, 2, 2],
+            [0, 0, 0, 0],
+            [0, 0, 4, 0],
+            [2, 2, 0, 2]
+        ]
+        # fmt: on
+
+    def test_round_trip(self):
+        board = pack(self.power_vals)
+        self.assertIsNotNone(board)
+        self.assertEqual(unpack(board).tolist(), self.power_vals)
+
+    def test_pack_rejects_non_powers(self):
+        bad_vals = [row[:] for row in self.power_vals]
+        bad_vals[0][0] = 3
+        self.assertIsNone(pack(bad_vals))
+
+        # 1 is root**0, indistinguishable from an empty cell
+        bad_vals[0][0] = 1
+        self.assertIsNone(pack(bad_vals))
+
+    def test_pack_rejects_overflow(self):
+        bad_vals = [row[:] for row in self.power_vals]
+        bad_vals[0][0] = 2**15
+        self.assertIsNone(pack(bad_vals))
+
+    def test_pack_other_root(self):
+        vals = [[3, 0, 9, 0] for _ in range(4)]
+        board = pack(vals, root=3)
+        self.assertIsNotNone(board)
+        self.assertEqual(unpack(board, root=3).tolist(), vals)
+
+    def test_reverse_row(self):
+        self.assertEqual(reverse_row(0x1234), 0x4321)
+        self.assertEqual(reverse_row(reverse_row(0xABCD)), 0xABCD)
+
+
+class TestRowSlide(unittest.TestCase):
+    def test_slide_merges_towards_zero(self):
+        # [2, 2, 4, 0] -> [4, 4, 0, 0], scoring the merged 4
+        row = 0x0211
+        new_row, score, _movement = slide_row_left(row, 2)
+        self.assertEqual(new_row, 0x0022)
+        self.assertEqual(score, 4)
+
+    def test_slide_does_not_double_merge(self):
+        # [2, 2, 2, 2] -> [4, 4, 0, 0], not [8, 0, 0, 0]
+        new_row, score, _movement = slide_row_left(0x1111, 2)
+        self.assertEqual(new_row, 0x0022)
+        self.assertEqual(score, 8)
+
+
+class TestFastBoard(unittest.TestCase):
+    def setUp(self):
+        # fmt: off
+        self.power_vals = [
+            [2, 2, 2, 2],
+            [0, 0, 0, 0],
+            [0, 0, 4, 0],
+            [2, 2, 0, 2]
+        ]
+        # fmt: on
+        self.board = FastBoard.from_values(self.power_vals)
+
+    def test_from_values(self):
+        self.assertIsNotNone(self.board)
+        self.assertIsNone(FastBoard.from_values([[7] * 4 for _ in range(4)]))
+
+    def test_transpose(self):
+        transposed = [list(row) for row in zip(*self.power_vals)]
+
+        self.board.transpose()
+        self.assertEqual(self.board.to_values().tolist(), transposed)
+
+        self.board.transpose()
+        self.assertEqual(self.board.to_values().tolist(), self.power_vals)
+
+    def test_slide_left(self):
+        score, movement = self.board.slide_left()
+        expected = [
+            [4, 4, 0, 0],
+            [0, 0, 0, 0],
+            [4, 0, 0, 0],
+            [4, 2, 0, 0],
+        ]
+        expected_movement = [
+            [0, -1, -1, -2],
+            [0, 0, 0, 0],
+            [0, 0, -2, 0],
+            [0, -1, 0, -2],
+        ]
+        self.assertEqual(self.board.to_values().tolist(), expected)
+        self.assertListEqual(movement, expected_movement)
+        self.assertEqual(score, 12)
+
+    def test_slide_up(self):
+        score, movement = self.board.slide_up()
+        expected = [
+            [4, 4, 2, 4],
+            [0, 0, 4, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+        expected_movement = [
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, -1, 0],
+            [-3, -3, 0, -3],
+        ]
+        self.assertEqual(self.board.to_values().tolist(), expected)
+        self.assertListEqual(movement, expected_movement)
+        self.assertEqual(score, 12)
+
+    def test_eq(self):
+        self.assertEqual(self.board, FastBoard.from_values(self.power_vals))
+        self.assertNotEqual(self.board, FastBoard())
+        self.assertNotEqual(self.board, self.board.board)